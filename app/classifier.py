@@ -1,9 +1,18 @@
+import asyncio
 import httpx
-import json
 import logging
+import orjson
+import time
+from typing import List, Optional
+
+from async_lru import alru_cache
+
 from config import settings
+from http_clients import get_groq_client
 from schemas import CategoryEnum, ClassificationResponse
-from resources import KEYWORDS, SYSTEM_PROMPT_TEMPLATE
+from resources import CATEGORY_BY_LOWER, KEYWORDS, SYSTEM_PROMPT, to_lower
+from scoring import score_all, score_text
+from semantic_cache import create_semantic_cache
 
 
 
@@ -13,48 +22,196 @@ logger = logging.getLogger(__name__)
 
 
 
+
+def _parse_partial_json(buf: str) -> Optional[dict]:
+    """
+    Tenta interpretar um JSON possivelmente incompleto vindo do stream.
+
+    Args:
+        buf: Conteúdo acumulado dos deltas do stream.
+
+    Returns:
+        Optional[dict]: Objeto parseado (completo ou fechado de forma
+            tolerante), ou None se ainda não for interpretável.
+    """
+
+    for suffix in ("", "\"}", "}"):
+        try:
+            parsed = orjson.loads(buf + suffix)
+        except orjson.JSONDecodeError:
+            continue
+
+        if isinstance(parsed, dict):
+            return parsed
+
+    return None
+
+
+
 class Classifier:
     """Classificador de mensagens jurídicas usando LLM ou heurísticas."""
     
-    def __init__(self) -> None:
-        """Inicializa o classificador carregando base de palavras-chave."""
+    def __init__(self, groq_client: Optional[httpx.AsyncClient] = None) -> None:
+        """
+        Inicializa o classificador carregando base de palavras-chave.
+
+        Args:
+            groq_client: Cliente HTTP compartilhado para a API do Groq. Se não
+                informado, o cliente singleton de `http_clients` é utilizado.
+        """
 
         self.keywords = KEYWORDS
+        self.groq_client = groq_client
+
+        # Limita chamadas simultâneas ao Groq: sob rajadas, o excedente espera
+        # aqui em vez de estourar o pool de conexões e colher 429s em cascata.
+        self._groq_sem = asyncio.Semaphore(settings.GROQ_MAX_INFLIGHT)
+        self.groq_inflight = 0
+
+        # Cache LRU assíncrono keyed pelo texto normalizado: textos repetidos
+        # (filas de suporte, tráfego de teste) retornam sem nova chamada à IA.
+        self._classify_cached = alru_cache(maxsize=settings.CACHE_MAXSIZE)(self._classify)
+
+        # Cache semântico opcional: textos similares (não idênticos) a uma
+        # consulta já respondida pelo LLM reaproveitam a classificação.
+        self.semantic_cache = create_semantic_cache()
+
         logger.debug("Classifier inicializado com sucesso.")
 
 
 
     async def classify(self, text: str) -> ClassificationResponse:
+        """
+        Classifica um texto, reutilizando resultados memoizados quando possível.
+
+        Textos idênticos após normalização (minúsculas, espaços colapsados)
+        compartilham a mesma entrada no cache LRU, evitando chamadas repetidas
+        ao Groq. O cache pode ser desativado via `settings.CACHE_ENABLED`.
+
+        Args:
+            text: Texto jurídico a ser classificado.
+
+        Returns:
+            ClassificationResponse: Resposta contendo categoria e raciocínio.
+        """
+
+        if not settings.CACHE_ENABLED:
+            return await self._classify(text)
+
+        norm_text = " ".join(to_lower(text).split())
+
+        hits_before = self._classify_cached.cache_info().hits
+        result = await self._classify_cached(norm_text)
+        was_cache_hit = self._classify_cached.cache_info().hits > hits_before
+
+        # Respostas degradadas por indisponibilidade momentânea da IA não
+        # ficam no cache: a próxima requisição do mesmo texto tenta o LLM de
+        # novo em vez de repetir a heurística até a entrada ser evictada.
+        if result.strategy == "Fallback-Heuristic":
+            self._classify_cached.cache_invalidate(norm_text)
+
+        logger.info(f"Classification cache | was_cache_hit={was_cache_hit}")
+        return result
+
+
+
+    async def classify_batch(self, texts: List[str]) -> List[ClassificationResponse]:
+        """
+        Classifica vários textos concorrentemente sobre o cliente compartilhado.
+
+        As chamadas compartilham o pool de conexões, o cache e o semáforo de
+        in-flight, então o lote amortiza handshakes sem estourar os limites
+        da API do Groq.
+
+        Args:
+            texts: Textos jurídicos a serem classificados.
+
+        Returns:
+            List[ClassificationResponse]: Respostas na mesma ordem dos textos.
+        """
+
+        return list(await asyncio.gather(*[self.classify(text) for text in texts]))
+
+
+
+    async def _classify(self, text: str) -> ClassificationResponse:
         """
         Tenta classificar texto via LLM (Groq). Se falhar, usa heurística local.
-        
+
         Args:
             text: Texto jurídico a ser classificado.
-        
+
         Returns:
             ClassificationResponse: Resposta contendo categoria e raciocínio.
         """
-        
+
+        # Minúsculas computadas uma única vez por requisição e reaproveitadas
+        # em todos os caminhos da heurística.
+        text_lower = to_lower(text)
+
         if not settings.GROQ_API_KEY:
             logger.warning("API Key não encontrada. Iniciando Fallback local.")
             return self._heuristic_classify(
-                text, 
-                reason="API Key do Groq não configurada. Fallback com heurística local ativado."
+                text,
+                reason="API Key do Groq não configurada. Fallback com heurística local ativado.",
+                text_lower=text_lower
             )
 
+        # Atalho de alta confiança: quando a heurística encontra uma categoria
+        # dominante, o resultado é bom o suficiente para pular o RTT do LLM;
+        # o Groq fica reservado para os casos ambíguos.
+        if settings.HEURISTIC_SHORTCUT_MIN_MATCHES > 0:
+            ranked = score_all(text_lower).most_common(2)
+
+            if ranked:
+                best_category, max_matches = ranked[0]
+                second_matches = ranked[1][1] if len(ranked) > 1 else 0
+
+                if (max_matches >= settings.HEURISTIC_SHORTCUT_MIN_MATCHES
+                        and second_matches <= max_matches // 2):
+                    logger.info(
+                        f"Heuristic shortcut | category={best_category.value} | "
+                        f"matches={max_matches} | second_matches={second_matches}"
+                    )
+                    return ClassificationResponse(
+                        category=best_category,
+                        reasoning=f"Identificados {max_matches} termos chave com categoria dominante; IA dispensada.",
+                        model="Keywords-Heuristic",
+                        strategy="Heuristic-HighConfidence"
+                    )
+
+        # Textos semanticamente próximos de uma consulta já respondida pelo
+        # LLM reutilizam a classificação sem nova chamada de rede.
+        if self.semantic_cache is not None:
+            cached = await self.semantic_cache.lookup(text)
+            if cached is not None:
+                return cached
+
         try:
             logger.debug("Iniciando chamada ao Groq API...")
-            return await self._call_groq_llm(text)
-        
+            result = await self._call_groq_llm(text)
+
+            if self.semantic_cache is not None:
+                await self.semantic_cache.add(text, result)
+
+            return result
+
         except httpx.HTTPStatusError as e:
             logger.error(f"Erro HTTP do Groq: status_code={e.response.status_code}")
-            return self._heuristic_classify(text, reason=f"Erro HTTP na IA ({e.response.status_code}).")
+            return self._heuristic_classify(
+                text,
+                reason=f"Erro HTTP na IA ({e.response.status_code}).",
+                text_lower=text_lower
+            )
         
-        except Exception as e:
+        # Apenas falhas esperadas de transporte/parse ativam o fallback; erros
+        # de programação propagam para o handler global e ficam visíveis.
+        except (httpx.TransportError, orjson.JSONDecodeError, KeyError) as e:
             logger.warning(f"Falha na conexão com LLM: {type(e).__name__}: {str(e)}. Ativando Fallback local.")
             return self._heuristic_classify(
-                text, 
-                reason="Indisponibilidade momentânea da IA."
+                text,
+                reason="Indisponibilidade momentânea da IA.",
+                text_lower=text_lower
             )
 
 
@@ -73,83 +230,115 @@ class Classifier:
             httpx.HTTPStatusError: Se a resposta HTTP indicar erro.
         """
         
-        categories_list = ", ".join([cat.value for cat in CategoryEnum])
-        formatted_system_prompt = SYSTEM_PROMPT_TEMPLATE.format(categories=categories_list)
-
         payload = {
             "model": settings.GROQ_MODEL,
             "messages": [
-                {"role": "system", "content": formatted_system_prompt},
+                {"role": "system", "content": SYSTEM_PROMPT},
                 {"role": "user", "content": text}
             ],
             "temperature": 0.2,
-            "response_format": {"type": "json_object"}
+            "response_format": {"type": "json_object"},
+            "stream": True,
+            "max_tokens": 64
         }
 
-        headers = {
-            "Authorization": f"Bearer {settings.GROQ_API_KEY}",
-            "Content-Type": "application/json"
-        }
+        # Reutiliza o cliente compartilhado (pool de conexões keep-alive),
+        # evitando um handshake TCP+TLS por chamada.
+        client = self.groq_client or get_groq_client()
 
+        buf = ""
+        content = None
 
-        async with httpx.AsyncClient() as client:
-            start_time = logging.time.time()
-            response = await client.post(
-                settings.GROQ_URL, 
-                json=payload, 
-                headers=headers, 
-                timeout=8.0
-            )
-            response.raise_for_status()
-            duration = logging.time.time() - start_time
-            
-            logger.info(f"Groq API success | duration={duration:.2f}s | status_code=200")
-            logger.debug(f"Processing JSON response from Groq API...")
-            
-            data = response.json()
-            content = json.loads(data['choices'][0]['message']['content'])
-            
-            cat_str = content.get("category", "Outros")
-            
-            category_enum = next(
-                (c for c in CategoryEnum if c.value.lower() == cat_str.lower()), 
-                CategoryEnum.OUTROS
-            )
+        async with self._groq_sem:
+            self.groq_inflight += 1
+            try:
+                start_time = time.perf_counter()
 
-            logger.debug(f"Parsed category from LLM: category={category_enum.value}")
+                # Streaming com early-exit: a categoria chega nos primeiros
+                # tokens; assim que o JSON acumulado contém uma categoria
+                # válida, o stream é fechado sem esperar o resto do reasoning.
+                # Os timeouts vêm da configuração do cliente compartilhado
+                # (settings.HTTP_TIMEOUTS), sem override por chamada.
+                async with client.stream(
+                    "POST",
+                    settings.GROQ_URL,
+                    json=payload
+                ) as response:
+                    response.raise_for_status()
 
-            return ClassificationResponse(
-                category=category_enum,
-                reasoning=content.get("reasoning", "Classificação via IA"),
-                model=settings.GROQ_MODEL,
-                strategy="LLM (Groq)"
-            )
+                    async for line in response.aiter_lines():
+                        if not line.startswith("data: "):
+                            continue
+
+                        chunk = line[len("data: "):]
+                        if chunk == "[DONE]":
+                            break
+
+                        choices = orjson.loads(chunk).get("choices")
+                        if not choices:
+                            continue
+
+                        delta = choices[0].get("delta", {}).get("content")
+                        if not delta:
+                            continue
+
+                        buf += delta
+                        content = _parse_partial_json(buf)
+
+                        # Só encerra cedo se a categoria parseada é conhecida,
+                        # evitando cortar um valor ainda pela metade.
+                        if content is not None and str(content.get("category", "")).lower() in CATEGORY_BY_LOWER:
+                            break
+
+                duration = time.perf_counter() - start_time
+            finally:
+                self.groq_inflight -= 1
+
+        logger.info(f"Groq API success | duration={duration:.2f}s | status_code=200")
+        logger.debug(f"Processing streamed JSON response from Groq API...")
+
+        if content is None:
+            # Stream terminou sem parse tolerante; um JSONDecodeError aqui
+            # ativa o fallback heurístico no chamador.
+            content = orjson.loads(buf)
+
+        cat_str = content.get("category", "Outros")
+
+        category_enum = CATEGORY_BY_LOWER.get(cat_str.lower(), CategoryEnum.OUTROS)
 
+        logger.debug(f"Parsed category from LLM: category={category_enum.value}")
+
+        return ClassificationResponse(
+            category=category_enum,
+            reasoning=content.get("reasoning", "Classificação via IA"),
+            model=settings.GROQ_MODEL,
+            strategy="LLM (Groq)"
+        )
 
 
-    def _heuristic_classify(self, text: str, reason: str) -> ClassificationResponse:
+
+    def _heuristic_classify(
+        self, text: str, reason: str, text_lower: Optional[str] = None
+    ) -> ClassificationResponse:
         """
         Classifica texto usando heurística baseada em palavras-chave.
-        
+
         Args:
             text: Texto jurídico a ser classificado.
             reason: Motivo pela qual o fallback foi acionado.
-        
+            text_lower: Versão em minúsculas já computada pelo chamador, para
+                evitar uma segunda passada sobre o texto.
+
         Returns:
             ClassificationResponse: Resposta com categoria identificada e raciocínio.
         """
 
         logger.info("Executando classificação heurística (Regras).")
-        
-        text_lower = text.lower()
-        best_category = CategoryEnum.OUTROS
-        max_matches = 0
-
-        for category, terms in self.keywords.items():
-            matches = sum(1 for term in terms if term in text_lower)
-            if matches > max_matches:
-                max_matches = matches
-                best_category = category
+
+        if text_lower is None:
+            text_lower = to_lower(text)
+
+        best_category, max_matches = score_text(text_lower)
 
         final_reason = (
             f"{reason} Identificados {max_matches} termos chave utilizando heurísticas." 
@@ -28,8 +28,31 @@ class Settings:
     GROQ_API_KEY: str = os.getenv("GROQ_API_KEY", "")
     
     GROQ_URL: str = "https://api.groq.com/openai/v1/chat/completions"
+    GROQ_MODELS_URL: str = "https://api.groq.com/openai/v1/models"
     GROQ_MODEL: str = "llama-3.3-70b-versatile"
 
+    # Timeouts do cliente HTTP compartilhado, em segundos. O timeout de pool
+    # fica em None: sob rajadas as chamadas esperam o semáforo/pool em vez de
+    # falhar e desperdiçar trabalho já enfileirado.
+    HTTP_TIMEOUTS: dict = {"connect": 5.0, "read": 10.0, "write": 5.0, "pool": None}
+
+    # Máximo de chamadas simultâneas em voo para a API do Groq (backpressure)
+    GROQ_MAX_INFLIGHT: int = int(os.getenv("GROQ_MAX_INFLIGHT", "16"))
+
+    # Atalho heurístico de alta confiança: pula o LLM quando a melhor categoria
+    # tem pelo menos N termos e o dobro da segunda colocada (0 desativa)
+    HEURISTIC_SHORTCUT_MIN_MATCHES: int = int(os.getenv("HEURISTIC_SHORTCUT_MIN_MATCHES", "3"))
+
+    # Cache LRU de resultados de classificação (desativável em testes)
+    CACHE_ENABLED: bool = os.getenv("CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+    CACHE_MAXSIZE: int = int(os.getenv("CACHE_MAXSIZE", "2048"))
+
+    # Cache semântico por embeddings (opcional, requer requirements-semantic.txt)
+    SEMANTIC_CACHE_ENABLED: bool = os.getenv("SEMANTIC_CACHE_ENABLED", "false").lower() in ("1", "true", "yes")
+    SEMANTIC_CACHE_MODEL: str = os.getenv("SEMANTIC_CACHE_MODEL", "paraphrase-multilingual-MiniLM-L12-v2")
+    SEMANTIC_CACHE_THRESHOLD: float = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.92"))
+    SEMANTIC_CACHE_MAXSIZE: int = int(os.getenv("SEMANTIC_CACHE_MAXSIZE", "2048"))
+
 
     def __init__(self) -> None:
         """Inicializa as configurações e valida a presença da chave da API Groq."""
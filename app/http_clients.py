@@ -0,0 +1,86 @@
+import logging
+from typing import Optional
+
+import httpx
+
+from config import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+# Cliente HTTP compartilhado (singleton). Criado no startup da aplicação e
+# reutilizado em todas as chamadas, mantendo conexões keep-alive abertas com
+# a API do Groq e evitando um handshake TCP+TLS por requisição.
+_groq_client: Optional[httpx.AsyncClient] = None
+
+
+
+
+def get_groq_client() -> httpx.AsyncClient:
+    """
+    Retorna o cliente HTTP compartilhado para a API do Groq, criando-o se necessário.
+
+    O cliente mantém um pool de conexões keep-alive, amortizando o custo do
+    handshake TLS entre requisições.
+
+    Returns:
+        httpx.AsyncClient: Cliente assíncrono compartilhado com pool de conexões.
+    """
+
+    global _groq_client
+
+    if _groq_client is None:
+        _groq_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            timeout=httpx.Timeout(**settings.HTTP_TIMEOUTS),
+            headers={"Authorization": f"Bearer {settings.GROQ_API_KEY}"},
+        )
+        logger.info("Groq HTTP client created | http2=yes | max_keepalive=20 | max_connections=100")
+
+    return _groq_client
+
+
+
+
+async def warmup_groq_client() -> None:
+    """
+    Pré-estabelece a conexão do pool com a API do Groq no startup.
+
+    Dispara uma requisição barata ao endpoint de modelos para pagar o
+    handshake TLS e a negociação HTTP/2 antes da primeira requisição real.
+    Falhas são apenas logadas: o warmup é oportunista, não obrigatório.
+    """
+
+    if not settings.GROQ_API_KEY:
+        logger.debug("Warmup skipped | groq_api_key_detected=no")
+        return
+
+    client = get_groq_client()
+
+    try:
+        response = await client.get(settings.GROQ_MODELS_URL, timeout=5.0)
+        logger.info(
+            f"Groq connection warmed | status_code={response.status_code} | "
+            f"http_version={response.http_version}"
+        )
+    except httpx.HTTPError as e:
+        logger.warning(f"Groq warmup failed | error_type={type(e).__name__}: {str(e)}")
+
+
+
+
+async def close_groq_client() -> None:
+    """
+    Fecha o cliente HTTP compartilhado e libera o pool de conexões.
+
+    Deve ser chamado no evento de shutdown da aplicação.
+    """
+
+    global _groq_client
+
+    if _groq_client is not None:
+        await _groq_client.aclose()
+        _groq_client = None
+        logger.info("Groq HTTP client closed")
@@ -1,12 +1,18 @@
 import sys
 import time
 import logging
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from config import settings
-from schemas import ClassificationRequest, ClassificationResponse
+from http_clients import get_groq_client, close_groq_client, warmup_groq_client
+from schemas import (
+    ClassificationBatchRequest,
+    ClassificationBatchResponse,
+    ClassificationRequest,
+    ClassificationResponse,
+)
 from classifier import Classifier
 
 
@@ -17,6 +23,7 @@ app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
     description="API de Classificação Jurídica Inteligente. Classifica mensagens em categorias específicas usando IA ou heurísticas.",
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -29,8 +36,46 @@ app.add_middleware(
 )
 
 
-# Inicializa o classificador
-classifier = Classifier()
+@app.on_event("startup")
+async def startup_event() -> None:
+    """
+    Inicializa o classificador e o cliente HTTP compartilhado no startup.
+
+    O cliente é reutilizado por todas as requisições, mantendo conexões
+    keep-alive abertas com a API do Groq. O warmup pré-estabelece a conexão
+    (TLS + HTTP/2) para que a primeira requisição real pague apenas o RTT.
+    """
+
+    app.state.groq_client = get_groq_client()
+    app.state.classifier = Classifier(groq_client=app.state.groq_client)
+    await warmup_groq_client()
+    logger.info("Startup complete | classifier and shared Groq HTTP client ready")
+
+
+
+
+@app.on_event("shutdown")
+async def shutdown_event() -> None:
+    """Fecha o cliente HTTP compartilhado e libera o pool de conexões."""
+
+    await close_groq_client()
+    logger.info("Shutdown complete | shared Groq HTTP client closed")
+
+
+
+
+def get_classifier(request: Request) -> Classifier:
+    """
+    Dependência FastAPI que retorna o classificador da instância da aplicação.
+
+    Args:
+        request: Objeto da requisição HTTP.
+
+    Returns:
+        Classifier: Classificador criado no startup, vinculado ao app.state.
+    """
+
+    return request.app.state.classifier
 
 
 
@@ -47,11 +92,11 @@ async def add_process_time_header(request: Request, call_next) -> JSONResponse:
         JSONResponse: Resposta HTTP com header de tempo de processamento.
     """
 
-    start_time = time.time()
-    
+    start_time = time.perf_counter()
+
     response = await call_next(request)
-    
-    process_time = time.time() - start_time
+
+    process_time = time.perf_counter() - start_time
     response.headers["X-Process-Time"] = str(round(process_time, 4))
     
     logger.info(f"HTTP request | method={request.method} | path={request.url.path} | status_code={response.status_code} | duration={round(process_time, 4)}s")
@@ -101,13 +146,15 @@ async def root() -> dict:
                 "example": {
                     "status": "healthy",
                     "mode": "LLM",
-                    "model": "llama-3.3-70b-versatile"
+                    "model": "llama-3.3-70b-versatile",
+                    "groq_inflight": 0,
+                    "groq_max_inflight": 16
                 }
             }
         }
     }
 })
-async def health_check() -> dict:
+async def health_check(clf: Classifier = Depends(get_classifier)) -> dict:
     """
     Verifica o status de saúde da API e modo operacional.
     
@@ -119,16 +166,19 @@ async def health_check() -> dict:
     - `Fallback`: Usando heurística local (sem acesso à API)
     
     Returns:
-        dict: Status da saúde, modo (LLM ou Fallback) e modelo utilizado.
+        dict: Status da saúde, modo (LLM ou Fallback), modelo utilizado e
+            profundidade da fila de chamadas ao Groq.
     """
 
     mode = "LLM" if settings.GROQ_API_KEY else "Fallback"
-    logger.info(f"Health check | mode={mode} | model={settings.GROQ_MODEL}")
+    logger.info(f"Health check | mode={mode} | model={settings.GROQ_MODEL} | groq_inflight={clf.groq_inflight}")
 
     return {
         "status": "healthy",
         "mode": mode,
-        "model": settings.GROQ_MODEL
+        "model": settings.GROQ_MODEL,
+        "groq_inflight": clf.groq_inflight,
+        "groq_max_inflight": settings.GROQ_MAX_INFLIGHT
     }
 
 
@@ -185,7 +235,10 @@ async def health_check() -> dict:
         }
     }
 })
-async def classify_text(request: ClassificationRequest) -> ClassificationResponse:
+async def classify_text(
+    request: ClassificationRequest,
+    clf: Classifier = Depends(get_classifier)
+) -> ClassificationResponse:
     """
     Classifica um texto jurídico em categorias predefinidas.
     
@@ -218,7 +271,7 @@ async def classify_text(request: ClassificationRequest) -> ClassificationRespons
     
 
     try:
-        result = await classifier.classify(request.text)
+        result = await clf.classify(request.text)
         logger.info(f"Classification completed | category={result.category.value} | strategy={result.strategy} | model={result.model}")
         return result
     
@@ -229,6 +282,98 @@ async def classify_text(request: ClassificationRequest) -> ClassificationRespons
 
 
 
+@app.post("/classify/batch", response_model=ClassificationBatchResponse, tags=["Inference"], responses={
+    200: {
+        "description": "Lote classificado com sucesso",
+        "content": {
+            "application/json": {
+                "example": {
+                    "results": [
+                        {
+                            "category": "Processual",
+                            "reasoning": "Questão sobre prazo e recurso processual",
+                            "model": "llama-3.3-70b-versatile",
+                            "strategy": "LLM (Groq)"
+                        }
+                    ]
+                }
+            }
+        }
+    },
+    400: {
+        "description": "Lote contém texto vazio",
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": "Os textos do lote não podem estar vazios."
+                }
+            }
+        }
+    },
+    422: {
+        "description": "Validação de entrada falhou",
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": [
+                        {
+                            "loc": ["body", "texts"],
+                            "msg": "List should have at most 32 items",
+                            "type": "too_long"
+                        }
+                    ]
+                }
+            }
+        }
+    },
+    500: {
+        "description": "Erro interno no servidor",
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": "Erro interno no servidor de classificação."
+                }
+            }
+        }
+    }
+})
+async def classify_batch(
+    request: ClassificationBatchRequest,
+    clf: Classifier = Depends(get_classifier)
+) -> ClassificationBatchResponse:
+    """
+    Classifica um lote de até 32 textos em uma única requisição.
+
+    As classificações rodam concorrentemente sobre o cliente HTTP compartilhado,
+    amortizando handshakes e reaproveitando o cache; o semáforo de in-flight
+    mantém o lote dentro dos limites da API do Groq.
+
+    **Respostas:**
+    - **200**: Lote classificado com sucesso (resultados na ordem de envio)
+    - **400**: Algum texto do lote está vazio
+    - **422**: Validação de entrada falhou (lote vazio ou acima de 32 textos)
+    - **500**: Erro interno no servidor
+    """
+
+    logger.info(f"Batch classification request | batch_size={len(request.texts)}")
+
+    if any(not text.strip() for text in request.texts):
+        logger.warning("Batch classification request with empty text")
+        raise HTTPException(status_code=400, detail="Os textos do lote não podem estar vazios.")
+
+
+    try:
+        results = await clf.classify_batch(request.texts)
+        logger.info(f"Batch classification completed | batch_size={len(results)}")
+        return ClassificationBatchResponse(results=results)
+
+    except Exception as e:
+        logger.error(f"Batch classification endpoint error | error_type={type(e).__name__} | message={str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Erro interno no servidor de classificação.")
+
+
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     """
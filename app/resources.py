@@ -1,3 +1,11 @@
+import re
+import string
+
+try:
+    import ahocorasick
+except ImportError:     # Extensão C opcional; a heurística degrada para str.count
+    ahocorasick = None
+
 from schemas import CategoryEnum
 
 
@@ -44,6 +52,56 @@ KEYWORDS = {
 
 
 
+# Autômato Aho-Corasick construído uma única vez no import. Encontra todas as
+# palavras-chave em uma única passada O(N) sobre o texto, em vez de uma busca
+# de substring independente por termo (O(K·N) para K≈130 termos). O valor de
+# cada termo é uma tupla de categorias: termos como "recurso" e "orçamento"
+# pertencem a mais de uma e todas devem receber crédito. Se a extensão C não
+# estiver disponível, fica None e a heurística usa o índice invertido.
+if ahocorasick is not None:
+    AUTOMATON = ahocorasick.Automaton()
+
+    _term_cats = {}
+    for _category, _terms in KEYWORDS.items():
+        for _term in _terms:
+            _lower = _term.lower()
+            _term_cats[_lower] = _term_cats.get(_lower, ()) + (_category,)
+
+    for _term, _cats in _term_cats.items():
+        AUTOMATON.add_word(_term, _cats)
+
+    AUTOMATON.make_automaton()
+
+else:
+    AUTOMATON = None
+
+
+
+
+# Layout alternativo das palavras-chave para o caminho sem pyahocorasick:
+# índice invertido token -> categorias (um lookup O(1) por token do texto,
+# sem loop categorias × termos) e os poucos termos compostos em listas para
+# busca de substring. Termos como "recurso" e "orçamento" pertencem a mais
+# de uma categoria, por isso o valor é uma tupla.
+TERM_TO_CATS = {}
+
+for _category, _terms in KEYWORDS.items():
+    for _term in _terms:
+        if " " not in _term:
+            TERM_TO_CATS[_term] = TERM_TO_CATS.get(_term, ()) + (_category,)
+
+MULTI_TERMS = {
+    category: [term for term in terms if " " in term]
+    for category, terms in KEYWORDS.items()
+}
+
+
+# Tokenizador compartilhado da heurística (uma passada por requisição)
+TOKEN_RE = re.compile(r"\w+")
+
+
+
+
 # Template do Prompt do Sistema (LLM) com Few-Shot
 SYSTEM_PROMPT_TEMPLATE = """
 Você é um classificador jurídico especializado do sistema Nexus. Sua tarefa é analisar a mensagem do usuário e classificá-la em uma das seguintes categorias, baseando-se no **contexto e intenção**, não apenas em palavras isoladas.
@@ -81,4 +139,47 @@ INSTRUÇÕES:
 CATEGORIAS DISPONÍVEIS: {categories}
 
 Agora, classifique a mensagem do usuário:
-"""
\ No newline at end of file
+"""
+
+
+
+
+# Tabela de tradução pré-construída cobrindo ASCII + acentuação do português.
+# `str.translate` com tabela fixa evita o case-folding Unicode completo de
+# `str.lower()` no texto ASCII-dominante das mensagens jurídicas.
+LOWER_TABLE = str.maketrans(
+    string.ascii_uppercase + "ÁÉÍÓÚÂÊÔÃÕÇÀÜ",
+    string.ascii_lowercase + "áéíóúâêôãõçàü",
+)
+
+
+
+
+def to_lower(text: str) -> str:
+    """
+    Converte texto para minúsculas em uma única passada via tabela pré-construída.
+
+    Args:
+        text: Texto de entrada.
+
+    Returns:
+        str: Texto em minúsculas (ASCII + acentos do português).
+    """
+
+    return text.translate(LOWER_TABLE)
+
+
+
+
+# Índice de categorias por valor em minúsculas. Permite resolver a categoria
+# retornada pelo LLM com um único lookup O(1), sem varrer o Enum a cada chamada.
+CATEGORY_BY_LOWER = {cat.value.lower(): cat for cat in CategoryEnum}
+
+
+
+
+# Prompt do sistema já formatado. As categorias são estáticas, então a junção
+# e o format() são feitos uma única vez no import, fora do caminho quente.
+SYSTEM_PROMPT = SYSTEM_PROMPT_TEMPLATE.format(
+    categories=", ".join(cat.value for cat in CategoryEnum)
+)
\ No newline at end of file
@@ -1,4 +1,6 @@
 from enum import Enum
+from typing import Annotated, List
+
 from pydantic import BaseModel, Field
 
 
@@ -25,8 +27,27 @@ class ClassificationRequest(BaseModel):
 
 
 
+class ClassificationBatchRequest(BaseModel):
+    # Cada item segue os mesmos limites de ClassificationRequest.text
+    texts: List[Annotated[str, Field(min_length=3, max_length=2000)]] = Field(
+        ...,
+        min_length=1,
+        max_length=32,
+        description="Lista de textos a classificar em uma única requisição (máximo 32).",
+        example=["Qual o prazo do recurso?", "O boleto dos honorários já venceu?"]
+    )
+
+
+
 class ClassificationResponse(BaseModel):
     category: CategoryEnum = Field(..., description="Categoria classificada.")
     reasoning: str = Field(..., description="Explicação do motivo da classificação.")
     model: str = Field(..., description="Modelo utilizado (ex: Llama3 ou Heuristic).")
-    strategy: str = Field(..., description="Estratégia utilizada: 'LLM' ou 'Fallback-Heuristic'.")
\ No newline at end of file
+    strategy: str = Field(..., description="Estratégia utilizada: 'LLM' ou 'Fallback-Heuristic'.")
+
+
+
+class ClassificationBatchResponse(BaseModel):
+    results: List[ClassificationResponse] = Field(
+        ..., description="Classificações na mesma ordem dos textos enviados."
+    )
\ No newline at end of file
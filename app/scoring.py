@@ -0,0 +1,81 @@
+"""
+Núcleo de pontuação da heurística, isolado para compilação AOT opcional.
+
+Este módulo contém apenas loops tipados sobre estruturas pré-computadas de
+`resources`, sem FastAPI/pydantic no caminho quente, e pode ser compilado
+para código nativo com mypyc:
+
+    python -m mypyc app/scoring.py
+
+O módulo compilado (`scoring.*.so`) tem precedência sobre o `.py` no import,
+então nenhuma mudança de código é necessária para usá-lo; sem a extensão,
+a versão interpretada funciona normalmente.
+"""
+
+from collections import Counter
+from typing import Tuple
+
+from schemas import CategoryEnum
+from resources import AUTOMATON, MULTI_TERMS, TERM_TO_CATS, TOKEN_RE
+
+
+
+
+def score_all(text_lower: str) -> Counter:
+    """
+    Pontua o texto contra as palavras-chave de todas as categorias.
+
+    Usa o autômato Aho-Corasick quando disponível (uma passada O(N)); caso
+    contrário, tokeniza o texto e consulta o índice invertido token->categorias.
+
+    Args:
+        text_lower: Texto já convertido para minúsculas.
+
+    Returns:
+        Counter: Número de termos casados por categoria (vazio se nada casar).
+    """
+
+    scores: Counter = Counter()
+
+    if AUTOMATON is not None:
+        for _, categories in AUTOMATON.iter(text_lower):
+            for category in categories:
+                scores[category] += 1
+
+    else:
+        count = text_lower.count
+
+        for tok in TOKEN_RE.findall(text_lower):
+            for category in TERM_TO_CATS.get(tok, ()):
+                scores[category] += 1
+
+        for category, phrases in MULTI_TERMS.items():
+            for phrase in phrases:
+                occurrences = count(phrase)
+                if occurrences:
+                    scores[category] += occurrences
+
+    return scores
+
+
+
+
+def score_text(text_lower: str) -> Tuple[CategoryEnum, int]:
+    """
+    Pontua o texto e retorna a melhor categoria com sua contagem.
+
+    Args:
+        text_lower: Texto já convertido para minúsculas.
+
+    Returns:
+        Tuple[CategoryEnum, int]: Melhor categoria e número de termos casados
+            (CategoryEnum.OUTROS e 0 se nada casar).
+    """
+
+    scores = score_all(text_lower)
+
+    if not scores:
+        return CategoryEnum.OUTROS, 0
+
+    best_category, max_matches = scores.most_common(1)[0]
+    return best_category, max_matches
@@ -0,0 +1,142 @@
+"""
+Cache semântico opcional: respostas reaproveitadas por similaridade de embedding.
+
+Além da memoização por texto exato, textos *parecidos* com uma consulta já
+classificada pelo LLM podem reutilizar a resposta sem nova chamada ao Groq.
+Cada texto é embutido com um modelo multilíngue pequeno e indexado em um
+FAISS IndexFlatIP; com embeddings normalizados, o produto interno equivale
+à similaridade de cosseno.
+
+As dependências são pesadas e opcionais (ver requirements-semantic.txt);
+sem elas, `create_semantic_cache()` retorna None e o classificador segue
+normalmente, no mesmo espírito do fallback heurístico.
+"""
+
+import asyncio
+import logging
+from typing import List, Optional
+
+try:
+    import faiss
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+except ImportError:     # Dependências opcionais; sem elas o cache fica inativo
+    faiss = None
+
+from config import settings
+from schemas import ClassificationResponse
+
+
+logger = logging.getLogger(__name__)
+
+
+
+
+class SemanticCache:
+    """Índice FAISS de consultas já classificadas, consultado por similaridade."""
+
+    def __init__(self) -> None:
+        """Carrega o modelo de embeddings e cria o índice vazio."""
+
+        self._model = SentenceTransformer(settings.SEMANTIC_CACHE_MODEL)
+        self._index = faiss.IndexFlatIP(self._model.get_sentence_embedding_dimension())
+        self._responses: List[ClassificationResponse] = []
+        self._lock = asyncio.Lock()
+
+        logger.info(
+            f"Semantic cache ready | model={settings.SEMANTIC_CACHE_MODEL} | "
+            f"threshold={settings.SEMANTIC_CACHE_THRESHOLD} | "
+            f"maxsize={settings.SEMANTIC_CACHE_MAXSIZE}"
+        )
+
+
+
+    async def _embed(self, text: str):
+        """Embute o texto fora do event loop (encode é CPU-bound)."""
+
+        return await asyncio.to_thread(
+            self._model.encode, [text], normalize_embeddings=True
+        )
+
+
+
+    async def lookup(self, text: str) -> Optional[ClassificationResponse]:
+        """
+        Busca uma resposta cacheada semanticamente próxima do texto.
+
+        Args:
+            text: Texto jurídico a ser classificado.
+
+        Returns:
+            Optional[ClassificationResponse]: Resposta reaproveitada com
+                estratégia 'Semantic-Cache', ou None se nada for similar o
+                suficiente.
+        """
+
+        if self._index.ntotal == 0:
+            return None
+
+        vec = await self._embed(text)
+        distances, indices = self._index.search(np.asarray(vec, dtype="float32"), 1)
+
+        similarity = float(distances[0, 0])
+        if similarity < settings.SEMANTIC_CACHE_THRESHOLD:
+            return None
+
+        cached = self._responses[int(indices[0, 0])]
+        logger.info(f"Semantic cache hit | similarity={similarity:.3f} | category={cached.category.value}")
+
+        return ClassificationResponse(
+            category=cached.category,
+            reasoning=cached.reasoning,
+            model=cached.model,
+            strategy="Semantic-Cache"
+        )
+
+
+
+    async def add(self, text: str, response: ClassificationResponse) -> None:
+        """
+        Indexa o texto e sua resposta para consultas futuras.
+
+        Args:
+            text: Texto classificado.
+            response: Resposta produzida pelo LLM para esse texto.
+        """
+
+        vec = await self._embed(text)
+
+        async with self._lock:
+            # Evicção FIFO limitada por SEMANTIC_CACHE_MAXSIZE: o IndexFlat
+            # usa ids posicionais e compacta na remoção, então descartar o
+            # vetor 0 mantém índice e lista de respostas alinhados.
+            while self._index.ntotal >= settings.SEMANTIC_CACHE_MAXSIZE:
+                self._index.remove_ids(np.array([0], dtype="int64"))
+                self._responses.pop(0)
+
+            self._index.add(np.asarray(vec, dtype="float32"))
+            self._responses.append(response)
+
+
+
+
+def create_semantic_cache() -> Optional[SemanticCache]:
+    """
+    Cria o cache semântico se habilitado e com as dependências instaladas.
+
+    Returns:
+        Optional[SemanticCache]: Instância pronta, ou None se o recurso está
+            desabilitado ou faiss/sentence-transformers não estão disponíveis.
+    """
+
+    if not settings.SEMANTIC_CACHE_ENABLED:
+        return None
+
+    if faiss is None:
+        logger.warning(
+            "Semantic cache enabled but dependencies missing. "
+            "Install requirements-semantic.txt to activate it."
+        )
+        return None
+
+    return SemanticCache()
@@ -0,0 +1,85 @@
+"""
+Benchmark do motor da heurística: Aho-Corasick vs alternação re2.
+
+Compara o autômato Aho-Corasick usado em produção (`resources.AUTOMATON`)
+com uma alternação regex compilada por categoria via google-re2 (DFA com
+garantia de tempo linear, sem backtracking). Ambos fazem uma única passada
+sobre o texto; o vencedor no corpus alvo fica no caminho quente.
+
+Resultado de referência (Python 3.11, corpus jurídico sintético ~700 chars):
+    ahocorasick ~18 us/chamada
+    re2         ~300 us/chamada  (findall por categoria aloca as capturas)
+
+Uso:
+    pip install google-re2
+    python scripts/bench_heuristic.py
+"""
+
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+import re2  # google-re2
+
+from resources import AUTOMATON, KEYWORDS
+
+
+SAMPLE_TEXT = (
+    "doutor, gostaria de saber se o valor dos honorários já inclui as custas "
+    "do processo, pois recebi uma intimação sobre o prazo do recurso de "
+    "apelação e o boleto da fatura. " * 4
+)
+
+ITERATIONS = 3000
+
+
+# Alternação única por categoria, com \b para casar palavras inteiras.
+PATTERNS = {
+    cat: re2.compile(r"(?i)\b(" + "|".join(re2.escape(t) for t in terms) + r")\b")
+    for cat, terms in KEYWORDS.items()
+}
+
+
+
+
+def classify_ahocorasick(text_lower: str):
+    """Uma passada do autômato, contagem por categoria (como scoring.score_all)."""
+
+    counts = Counter()
+    for _, categories in AUTOMATON.iter(text_lower):
+        for category in categories:
+            counts[category] += 1
+    return counts.most_common(1)[0]
+
+
+
+
+def classify_re2(text_lower: str):
+    """Um findall de alternação DFA por categoria."""
+
+    matches = {cat: len(p.findall(text_lower)) for cat, p in PATTERNS.items()}
+    best = max(matches, key=matches.get)
+    return best, matches[best]
+
+
+
+
+def bench(name, fn) -> None:
+    fn(SAMPLE_TEXT)  # aquecimento
+
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        fn(SAMPLE_TEXT)
+    per_call = (time.perf_counter() - start) / ITERATIONS
+
+    print(f"{name:<12} {per_call * 1e6:8.1f} us/chamada | resultado={fn(SAMPLE_TEXT)}")
+
+
+
+
+if __name__ == "__main__":
+    bench("ahocorasick", classify_ahocorasick)
+    bench("re2", classify_re2)
@@ -0,0 +1,7 @@
+import sys
+from pathlib import Path
+
+
+# Os módulos da aplicação usam imports planos (from config import settings),
+# então o diretório app/ precisa estar no sys.path durante os testes.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
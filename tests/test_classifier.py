@@ -0,0 +1,153 @@
+"""
+Testes do Classifier com a API do Groq simulada via httpx.MockTransport.
+
+Cobrem a regressão que desativou silenciosamente o caminho LLM (o antigo
+`logging.time.time()`): um cliente mockado injetado no classificador deve
+produzir `strategy == "LLM (Groq)"`, e apenas erros de transporte devem
+degradar para a heurística.
+"""
+
+import asyncio
+
+import httpx
+import orjson
+import pytest
+
+from config import settings
+from classifier import Classifier
+
+
+# Texto sem palavras-chave: não aciona o atalho heurístico de alta confiança.
+AMBIGUOUS_TEXT = "mensagem genérica sem termos específicos"
+
+LLM_CONTENT = '{"category": "Processual", "reasoning": "Questão sobre prazo"}'
+
+
+
+
+def sse_body(content: str) -> str:
+    """Monta um corpo SSE no formato de streaming da API do Groq."""
+
+    chunk = orjson.dumps({"choices": [{"delta": {"content": content}}]}).decode()
+    return f"data: {chunk}\n\ndata: [DONE]\n\n"
+
+
+
+
+def groq_ok_handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(
+        200,
+        text=sse_body(LLM_CONTENT),
+        headers={"content-type": "text/event-stream"},
+    )
+
+
+
+
+@pytest.fixture
+def groq_key(monkeypatch):
+    """Habilita o caminho LLM durante o teste."""
+
+    monkeypatch.setattr(settings, "GROQ_API_KEY", "test-key")
+
+
+
+
+def test_classify_returns_llm_strategy(groq_key):
+    """Com a API respondendo, classify() deve usar a estratégia LLM."""
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(groq_ok_handler)) as client:
+            clf = Classifier(groq_client=client)
+            return await clf.classify("Qual o prazo do recurso neste caso?")
+
+    result = asyncio.run(run())
+
+    assert result.strategy == "LLM (Groq)"
+    assert result.category.value == "Processual"
+    assert result.model == settings.GROQ_MODEL
+
+
+
+
+def test_transport_error_falls_back_to_heuristic(groq_key):
+    """Erros de transporte degradam para a heurística, sem propagar."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("connection refused")
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            clf = Classifier(groq_client=client)
+            return await clf.classify(AMBIGUOUS_TEXT)
+
+    result = asyncio.run(run())
+
+    assert result.strategy == "Fallback-Heuristic"
+
+
+
+
+def test_programming_error_propagates(groq_key):
+    """Bugs não viram fallback silencioso: exceções inesperadas propagam."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise TypeError("bug")
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            clf = Classifier(groq_client=client)
+            return await clf.classify(AMBIGUOUS_TEXT)
+
+    with pytest.raises(TypeError):
+        asyncio.run(run())
+
+
+
+
+def test_fallback_result_is_not_cached(groq_key):
+    """Uma falha transitória não pode fixar a resposta heurística no cache."""
+
+    calls = {"n": 0}
+
+    def flaky_handler(request: httpx.Request) -> httpx.Response:
+        calls["n"] += 1
+        if calls["n"] == 1:
+            raise httpx.ConnectError("momentary outage")
+        return groq_ok_handler(request)
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(flaky_handler)) as client:
+            clf = Classifier(groq_client=client)
+            first = await clf.classify(AMBIGUOUS_TEXT)
+            second = await clf.classify(AMBIGUOUS_TEXT)
+            third = await clf.classify(AMBIGUOUS_TEXT)
+            return first, second, third
+
+    first, second, third = asyncio.run(run())
+
+    assert first.strategy == "Fallback-Heuristic"
+    assert second.strategy == "LLM (Groq)"       # reconsultou o LLM
+    assert third.strategy == "LLM (Groq)"
+    assert calls["n"] == 2                       # terceira veio do cache
+
+
+
+
+def test_heuristic_shortcut_skips_llm(groq_key):
+    """Categoria dominante na heurística dispensa a chamada ao Groq."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise AssertionError("LLM não deveria ser chamado")
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            clf = Classifier(groq_client=client)
+            return await clf.classify(
+                "recebi a intimação do juiz sobre o prazo da audiência do processo"
+            )
+
+    result = asyncio.run(run())
+
+    assert result.strategy == "Heuristic-HighConfidence"
+    assert result.category.value == "Processual"